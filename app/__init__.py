@@ -4,9 +4,13 @@ Creates and configures the Flask application.
 """
 
 from flask import Flask, render_template
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
 import logging
+import orjson
 import os
+import pathlib
 import sys
 
 # Add parent directory to path for imports
@@ -15,6 +19,19 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import get_config
 
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for fast (de)serialization."""
+
+    # Serialize numpy scalars directly and treat naive datetimes as UTC
+    _OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=self._OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 def create_app(config_name: str = None):
     """
     Create and configure the Flask application.
@@ -34,6 +51,12 @@ def create_app(config_name: str = None):
     # Load configuration
     config = get_config()
     app.config.from_object(config)
+
+    # Use orjson for all JSON responses (SIMD-accelerated encoding)
+    app.json = OrjsonProvider(app)
+
+    # Compress JSON/static responses (brotli preferred, gzip fallback)
+    Compress(app)
     
     # Configure logging
     logging.basicConfig(
@@ -54,6 +77,11 @@ def create_app(config_name: str = None):
     # Register blueprints
     from app.routes.api import api_bp
     app.register_blueprint(api_bp)
+
+    # Static forecast file location, resolved once at startup
+    app.config['FORECAST_PATH'] = (
+        pathlib.Path(app.root_path).parent / 'static' / 'data' / 'forecast.json'
+    )
     
     # Main page route
     @app.route('/')
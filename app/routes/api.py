@@ -3,11 +3,13 @@ API Routes for Interest Rate Monitor
 Provides RESTful endpoints for rate data, AI analysis, and news.
 """
 
-from flask import Blueprint, jsonify, request, current_app
+from flask import Blueprint, Response, jsonify, request, current_app
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import hashlib
 import logging
-import json
-import os
+import orjson
+import time
 
 from app.services.rate_service import get_rate_service
 from app.services.ai_analysis_service import get_ai_service
@@ -20,12 +22,36 @@ logger = logging.getLogger(__name__)
 # Create Blueprint
 api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
 
+# In-memory cache for the parsed forecast.json, invalidated by file
+# mtime. Stored as one tuple so concurrent readers always see the
+# mtime paired with the payload parsed from that same file version.
+_forecast_cache = (None, None)
+
+# Shared executor for running independent service I/O concurrently
+_io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='api-io')
+
+
+# Cached ISO timestamp, reused for calls within the same second.
+# Stored as one tuple so concurrent readers always see a matching pair.
+_ts_cache = (0, "")
+
+
+def _iso_now() -> str:
+    """Current time as an ISO string, formatted at most once per second."""
+    global _ts_cache
+    t = int(time.time())
+    second, stamp = _ts_cache
+    if t != second:
+        stamp = datetime.fromtimestamp(t).isoformat()
+        _ts_cache = (t, stamp)
+    return stamp
+
 
 def create_response(status: str, data=None, error: str = None):
     """Create standardized API response."""
     response = {
         "status": status,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _iso_now(),
     }
     if data is not None:
         response["data"] = data
@@ -34,6 +60,69 @@ def create_response(status: str, data=None, error: str = None):
     return response
 
 
+# Flask-Compress rewrites strong ETags to "<etag>:<algorithm>", so the
+# tag a client sends back carries the suffix of the encoding it received
+_COMPRESS_SUFFIXES = ('br', 'gzip', 'zstd', 'deflate')
+
+
+def _etag_matches(etag: str) -> bool:
+    """True if If-None-Match holds etag, bare or algorithm-suffixed."""
+    if_none_match = request.if_none_match
+    if if_none_match.contains(etag):
+        return True
+    return any(
+        if_none_match.contains(f"{etag}:{algorithm}")
+        for algorithm in _COMPRESS_SUFFIXES
+    )
+
+
+def etagged(data, etag: str = None):
+    """
+    Build a success response with a strong ETag and honor If-None-Match.
+
+    Returns a 0-byte 304 when the client already holds the current payload,
+    skipping serialization and transfer entirely.
+
+    Args:
+        data: JSON-serializable payload for create_response
+        etag: Precomputed ETag; derived from the payload bytes if omitted
+
+    Returns:
+        Flask Response with ETag header (full body or 304)
+    """
+    if etag is None:
+        payload = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        etag = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    else:
+        payload = None
+
+    if _etag_matches(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    if payload is not None:
+        # Splice the already-serialized payload into the envelope
+        # instead of serializing the data a second time
+        body = (
+            b'{"status":"success","timestamp":"'
+            + _iso_now().encode()
+            + b'","data":'
+            + payload
+            + b'}'
+        )
+    else:
+        # Serialize the envelope once with orjson (jsonify would re-serialize)
+        body = orjson.dumps(
+            create_response(status="success", data=data),
+            option=orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    return response
+
+
 @api_bp.route('/rates', methods=['GET'])
 def get_rates():
     """
@@ -58,24 +147,19 @@ def get_rates():
                 error="No rate data available"
             )), 404
         
-        # Convert to JSON-serializable format
-        records = []
-        for _, row in combined_data.iterrows():
-            records.append({
-                "date": row["date"].strftime("%Y-%m-%d"),
-                "us_rate": round(float(row["us_rate"]), 3),
-                "kr_rate": round(float(row["kr_rate"]), 3),
-                "spread": round(float(row["spread"]), 1)
-            })
+        # Convert to JSON-serializable format (vectorized: strftime/round run in C)
+        records = combined_data.assign(
+            date=combined_data["date"].dt.strftime("%Y-%m-%d"),
+            us_rate=combined_data["us_rate"].round(3),
+            kr_rate=combined_data["kr_rate"].round(3),
+            spread=combined_data["spread"].round(1)
+        )[["date", "us_rate", "kr_rate", "spread"]].to_dict(orient="records")
         
-        return jsonify(create_response(
-            status="success",
-            data={
-                "rates": records,
-                "count": len(records),
-                "period_days": days
-            }
-        ))
+        return etagged({
+            "rates": records,
+            "count": len(records),
+            "period_days": days
+        })
         
     except Exception as e:
         logger.error(f"Error fetching rates: {e}")
@@ -129,8 +213,15 @@ def get_analysis():
         ai_service = get_ai_service()
         news_service = get_news_service()
 
-        # Get rate data for analysis
-        combined_data = rate_service.get_combined_rates(days=30)
+        # Fetch rate data and news concurrently - the three calls are
+        # independent I/O, so latency is max(ops) instead of sum(ops)
+        f_rates = _io_executor.submit(rate_service.get_combined_rates, days=30)
+        f_us_news = _io_executor.submit(news_service.get_us_rate_news, 5)
+        f_kr_news = _io_executor.submit(news_service.get_kr_rate_news, 5)
+
+        combined_data = f_rates.result()
+        us_news = f_us_news.result()
+        kr_news = f_kr_news.result()
 
         if combined_data.empty:
             return jsonify(create_response(
@@ -138,15 +229,12 @@ def get_analysis():
                 error="Insufficient rate data for analysis"
             )), 404
 
-        # Prepare data for analysis
-        us_rates = combined_data[["date", "us_rate"]].copy()
-        kr_rates = combined_data[["date", "kr_rate"]].copy()
+        # Prepare data for analysis - column subsets are read-only here,
+        # so pass the views without copying the underlying blocks
+        us_rates = combined_data[["date", "us_rate"]]
+        kr_rates = combined_data[["date", "kr_rate"]]
         current_spread = combined_data.iloc[-1]["spread"]
 
-        # Get news data for analysis
-        us_news = news_service.get_us_rate_news(limit=5)
-        kr_news = news_service.get_kr_rate_news(limit=5)
-
         # Generate analysis with news context
         analysis_text = ai_service.generate_rate_analysis(
             us_rates=us_rates,
@@ -156,14 +244,18 @@ def get_analysis():
             kr_news=kr_news
         )
 
-        return jsonify(create_response(
-            status="success",
-            data={
-                "analysis": analysis_text,
-                "generated_at": datetime.now().isoformat(),
-                "data_date": combined_data.iloc[-1]["date"].strftime("%Y-%m-%d")
-            }
-        ))
+        # ETag over the analysis itself: stable while the cached text is unchanged
+        data_date = combined_data.iloc[-1]["date"].strftime("%Y-%m-%d")
+        etag = hashlib.blake2b(
+            f"{data_date}:{analysis_text}".encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+
+        return etagged({
+            "analysis": analysis_text,
+            "generated_at": _iso_now(),
+            "data_date": data_date
+        }, etag=etag)
 
     except Exception as e:
         logger.error(f"Error generating analysis: {e}")
@@ -272,29 +364,33 @@ def get_forecast():
         JSON with 12-month forecast data
     """
     try:
-        # Get the path to forecast.json
-        forecast_path = os.path.join(
-            current_app.root_path,
-            '..',
-            'static',
-            'data',
-            'forecast.json'
-        )
-        forecast_path = os.path.normpath(forecast_path)
+        # Path is resolved once at app startup
+        forecast_path = current_app.config['FORECAST_PATH']
 
-        if not os.path.exists(forecast_path):
+        try:
+            st = forecast_path.stat()
+        except FileNotFoundError:
             return jsonify(create_response(
                 status="error",
                 error="Forecast data not found"
             )), 404
 
-        with open(forecast_path, 'r', encoding='utf-8') as f:
-            forecast_data = json.load(f)
+        # ETag from file metadata so the body hash isn't recomputed per request
+        etag = f"{st.st_mtime_ns:x}-{st.st_size:x}"
 
-        return jsonify(create_response(
-            status="success",
-            data=forecast_data
-        ))
+        if _etag_matches(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            return response
+
+        # Reuse the parsed dict while the file is unchanged
+        global _forecast_cache
+        cached_mtime, forecast_data = _forecast_cache
+        if cached_mtime != st.st_mtime_ns:
+            forecast_data = orjson.loads(forecast_path.read_bytes())
+            _forecast_cache = (st.st_mtime_ns, forecast_data)
+
+        return etagged(forecast_data, etag=etag)
 
     except Exception as e:
         logger.error(f"Error fetching forecast: {e}")
@@ -335,10 +431,15 @@ def chat():
         news_service = get_news_service()
         chat_service = get_chat_service()
 
+        # Fetch rate and news context concurrently
+        f_latest = _io_executor.submit(rate_service.get_latest_rates)
+        f_us_news = _io_executor.submit(news_service.get_us_rate_news, 7)
+        f_kr_news = _io_executor.submit(news_service.get_kr_rate_news, 7)
+
         # Get current rate context
         rate_context = None
         try:
-            latest = rate_service.get_latest_rates()
+            latest = f_latest.result()
             if not latest.get("error"):
                 rate_context = {
                     "us_rate": latest.get("us_rate"),
@@ -352,8 +453,8 @@ def chat():
         us_news = None
         kr_news = None
         try:
-            us_news = news_service.get_us_rate_news(limit=7)
-            kr_news = news_service.get_kr_rate_news(limit=7)
+            us_news = f_us_news.result()
+            kr_news = f_kr_news.result()
         except Exception:
             pass  # Continue without news context
 
@@ -369,7 +470,7 @@ def chat():
             status="success",
             data={
                 "response": response_text,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _iso_now()
             }
         ))
 
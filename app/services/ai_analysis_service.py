@@ -5,17 +5,44 @@ Generates market analysis for interest rate trends.
 
 import os
 import logging
+import re
+import threading
+from concurrent.futures import Future
 import requests
 from typing import Optional
 from datetime import datetime
 from cachetools import TTLCache
+import numpy as np
+import orjson
 import pandas as pd
+import xxhash
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from config import ANALYSIS_CACHE_TTL
+
+# Module logger (the app factory configures handlers/levels)
 logger = logging.getLogger(__name__)
 
 
+def _parse_json(response: requests.Response) -> dict:
+    """Parse a response body with orjson straight from the bytes buffer."""
+    return orjson.loads(response.content)
+
+
+def _summary_kernel(us_arr: np.ndarray, kr_arr: np.ndarray) -> tuple:
+    """Numeric kernel for the fallback analysis: latest values and
+    period changes for both series in one pass over the raw arrays.
+
+    Returns:
+        (us_latest, us_change, kr_latest, kr_change) as Python floats
+    """
+    return (
+        float(us_arr[-1]),
+        float(us_arr[-1] - us_arr[0]),
+        float(kr_arr[-1]),
+        float(kr_arr[-1] - kr_arr[0]),
+    )
+
+
 class AIAnalysisService:
     """Service for generating AI-powered interest rate analysis using Groq + Qwen."""
 
@@ -25,9 +52,6 @@ class AIAnalysisService:
     # Qwen3 32B model on Groq
     MODEL_NAME = "qwen/qwen3-32b"
 
-    # Cache for analysis (TTL: 6 hours)
-    _cache = TTLCache(maxsize=10, ttl=21600)
-
     # Analysis prompt template
     ANALYSIS_PROMPT = """당신은 채권 시장 전문 애널리스트입니다. 아래의 미국과 한국 10년물 국고채 금리 데이터와 최신 뉴스를 종합하여 시장 동향을 분석해 주세요.
 
@@ -60,10 +84,61 @@ class AIAnalysisService:
 
 분석 결과:"""
 
+    # Static head/tail of the legacy chat system prompt, built once at
+    # class load; only the market context in the middle varies per call
+    _CHAT_PROMPT_HEAD = """당신은 금리 및 채권 시장 전문 AI 어시스턴트입니다.
+사용자의 질문에 친절하고 전문적으로 답변해 주세요.
+
+현재 시장 상황:
+"""
+
+    _CHAT_PROMPT_TAIL = """
+
+답변 규칙:
+- 한국어로 답변하세요
+- 간결하고 명확하게 답변하세요 (최대 3-4문장)
+- 금리, 채권, 통화정책 관련 질문에 집중하세요
+- 투자 조언은 일반적인 정보 제공 수준으로만 하세요
+- 구체적인 수치가 있으면 포함하세요
+
+/no_think"""
+
+    # Template pre-split at class load so rendering is a single join
+    # instead of re-parsing the format string on every call
+    _PROMPT_SEGMENTS = re.split(r"\{(\w+)\}", ANALYSIS_PROMPT)
+
+    @classmethod
+    def _render_prompt(cls, **fields) -> str:
+        """Render ANALYSIS_PROMPT from pre-split segments."""
+        return "".join(
+            fields[segment] if i % 2 else segment
+            for i, segment in enumerate(cls._PROMPT_SEGMENTS)
+        )
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the AI service with API key."""
         self.api_key = api_key or os.getenv('GROQ_API_KEY')
 
+        # Per-instance analysis cache (TTL: 6 hours). TTLCache is not
+        # thread-safe, so all access goes through the lock.
+        self._cache = TTLCache(maxsize=16, ttl=ANALYSIS_CACHE_TTL)
+        self._cache_lock = threading.RLock()
+
+        # In-flight generation futures for request coalescing
+        self._inflight: dict = {}
+
+        # Pooled session with keep-alive so repeated Groq calls reuse the
+        # TCP+TLS connection instead of handshaking each time
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        )
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+
         if self.api_key:
             logger.info("Groq AI analysis service initialized with Qwen3 32B")
         else:
@@ -92,14 +167,58 @@ class AIAnalysisService:
         """
         # Check cache first
         cache_key = self._get_cache_key(us_rates, kr_rates)
-        if cache_key in self._cache:
-            logger.info("Returning cached analysis")
-            return self._cache[cache_key]
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Returning cached analysis")
+            return cached
 
         if not self.api_key:
             logger.warning("AI model not available, returning default message")
             return self._get_default_analysis(us_rates, kr_rates, spread)
 
+        # Single-flight: only the first caller for a given key issues the
+        # Groq request; concurrent callers await its result instead of
+        # spawning duplicate requests after a TTL expiry
+        with self._cache_lock:
+            future = self._inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[cache_key] = future
+
+        if not leader:
+            logger.debug("Awaiting in-flight analysis generation")
+            try:
+                return future.result(timeout=35)
+            except Exception:
+                return self._get_default_analysis(us_rates, kr_rates, spread)
+
+        try:
+            analysis = self._generate_analysis(
+                us_rates, kr_rates, spread, us_news, kr_news, cache_key
+            )
+            future.set_result(analysis)
+            return analysis
+        except BaseException as e:
+            # Complete the future on failure too, or every coalesced
+            # follower would block its full result() timeout
+            future.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(cache_key, None)
+
+    def _generate_analysis(
+        self,
+        us_rates: pd.DataFrame,
+        kr_rates: pd.DataFrame,
+        spread: float,
+        us_news: list,
+        kr_news: list,
+        cache_key: str
+    ) -> str:
+        """Issue the Groq request and cache the result (single caller)."""
         try:
             # Prepare data summary for prompt
             us_summary = self._format_rate_data(us_rates, "us_rate")
@@ -110,7 +229,7 @@ class AIAnalysisService:
             kr_news_summary = self._format_news_data(kr_news)
 
             # Build prompt
-            prompt = self.ANALYSIS_PROMPT.format(
+            prompt = self._render_prompt(
                 us_data=us_summary,
                 kr_data=kr_summary,
                 spread=f"{spread:.1f}",
@@ -118,12 +237,7 @@ class AIAnalysisService:
                 kr_news=kr_news_summary
             )
 
-            # Prepare request
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-
+            # Prepare request (auth headers are set once on the session)
             payload = {
                 "model": self.MODEL_NAME,
                 "messages": [
@@ -134,15 +248,14 @@ class AIAnalysisService:
             }
 
             # Make API request
-            response = requests.post(
+            response = self._session.post(
                 self.API_URL,
-                headers=headers,
                 json=payload,
                 timeout=30
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 if data.get("choices") and len(data["choices"]) > 0:
                     analysis = data["choices"][0]["message"]["content"].strip()
 
@@ -156,7 +269,8 @@ class AIAnalysisService:
                         analysis = self._get_default_analysis(us_rates, kr_rates, spread)
 
                     # Cache the result
-                    self._cache[cache_key] = analysis
+                    with self._cache_lock:
+                        self._cache[cache_key] = analysis
                     logger.info("Generated new AI analysis via Groq")
 
                     return analysis
@@ -166,7 +280,7 @@ class AIAnalysisService:
                 return self._get_default_analysis(us_rates, kr_rates, spread)
 
             else:
-                error_msg = response.json().get("error", {}).get("message", "Unknown error")
+                error_msg = _parse_json(response).get("error", {}).get("message", "Unknown error")
                 logger.error(f"Groq API error: {response.status_code} - {error_msg}")
                 return self._get_default_analysis(us_rates, kr_rates, spread)
 
@@ -183,16 +297,18 @@ class AIAnalysisService:
         if df.empty:
             return "데이터 없음"
 
-        # Get summary statistics
-        latest = df.iloc[-1][rate_col] if len(df) > 0 else 0
-        first = df.iloc[0][rate_col] if len(df) > 0 else 0
+        # Single NumPy pass instead of repeated pandas indexing
+        arr = df[rate_col].to_numpy()
+        latest = arr[-1]
+        first = arr[0]
         change = latest - first
-        high = df[rate_col].max()
-        low = df[rate_col].min()
+        high = arr.max()
+        low = arr.min()
 
         # Get dates
-        start_date = df.iloc[0]["date"].strftime("%Y-%m-%d") if len(df) > 0 else "N/A"
-        end_date = df.iloc[-1]["date"].strftime("%Y-%m-%d") if len(df) > 0 else "N/A"
+        start_date, end_date = np.datetime_as_string(
+            df["date"].to_numpy()[[0, -1]], unit="D"
+        )
 
         return (
             f"기간: {start_date} ~ {end_date}\n"
@@ -203,23 +319,31 @@ class AIAnalysisService:
 
     def _format_news_data(self, news_list: list) -> str:
         """Format news data for the prompt."""
-        if not news_list or len(news_list) == 0:
+        if not news_list:
             return "최신 뉴스 없음"
 
-        news_texts = []
-        for i, item in enumerate(news_list[:5], 1):  # Max 5 news items
-            title = item.get('title', '')
-            source = item.get('source', '')
-            if title:
-                news_texts.append(f"{i}. [{source}] {title}")
-
-        return "\n".join(news_texts) if news_texts else "최신 뉴스 없음"
+        # Single join over a generator; max 5 news items
+        parts = (
+            f"{i}. [{item.get('source', '')}] {title}"
+            for i, item in enumerate(news_list[:5], 1)
+            if (title := item.get('title'))
+        )
+        return "\n".join(parts) or "최신 뉴스 없음"
 
     def _get_cache_key(self, us_rates: pd.DataFrame, kr_rates: pd.DataFrame) -> str:
-        """Generate cache key based on latest data."""
-        us_latest = us_rates.iloc[-1]["date"].strftime("%Y%m%d") if not us_rates.empty else "none"
-        kr_latest = kr_rates.iloc[-1]["date"].strftime("%Y%m%d") if not kr_rates.empty else "none"
-        return f"analysis_{us_latest}_{kr_latest}"
+        """Generate cache key by hashing the underlying rate/date bytes.
+
+        Keying on content (not just the latest date) means intra-day
+        revisions to the series produce a fresh analysis.
+        """
+        h = xxhash.xxh3_64()
+        if not us_rates.empty:
+            h.update(us_rates["date"].to_numpy().tobytes())
+            h.update(us_rates["us_rate"].to_numpy().tobytes())
+        if not kr_rates.empty:
+            h.update(kr_rates["date"].to_numpy().tobytes())
+            h.update(kr_rates["kr_rate"].to_numpy().tobytes())
+        return f"analysis_{h.hexdigest()}"
 
     def _get_default_analysis(
         self,
@@ -231,11 +355,11 @@ class AIAnalysisService:
         if us_rates.empty or kr_rates.empty:
             return "현재 금리 데이터를 불러올 수 없어 분석이 제공되지 않습니다. 잠시 후 다시 시도해 주세요."
 
-        # Calculate basic metrics
-        us_latest = us_rates.iloc[-1]["us_rate"]
-        kr_latest = kr_rates.iloc[-1]["kr_rate"]
-        us_change = us_rates.iloc[-1]["us_rate"] - us_rates.iloc[0]["us_rate"]
-        kr_change = kr_rates.iloc[-1]["kr_rate"] - kr_rates.iloc[0]["kr_rate"]
+        # Calculate basic metrics from the raw arrays
+        us_latest, us_change, kr_latest, kr_change = _summary_kernel(
+            us_rates["us_rate"].to_numpy(),
+            kr_rates["kr_rate"].to_numpy()
+        )
 
         # Determine trend direction
         us_trend = "상승" if us_change > 0.05 else ("하락" if us_change < -0.05 else "보합")
@@ -261,7 +385,8 @@ class AIAnalysisService:
 
     def clear_cache(self):
         """Clear the analysis cache."""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
         logger.info("Analysis cache cleared")
 
     def chat(self, message: str, context: dict = None) -> str:
@@ -282,25 +407,10 @@ class AIAnalysisService:
                     f"스프레드: {context.get('spread', 'N/A')}bp"
                 )
 
-            system_prompt = f"""당신은 금리 및 채권 시장 전문 AI 어시스턴트입니다.
-사용자의 질문에 친절하고 전문적으로 답변해 주세요.
-
-현재 시장 상황:
-{context_text}
-
-답변 규칙:
-- 한국어로 답변하세요
-- 간결하고 명확하게 답변하세요 (최대 3-4문장)
-- 금리, 채권, 통화정책 관련 질문에 집중하세요
-- 투자 조언은 일반적인 정보 제공 수준으로만 하세요
-- 구체적인 수치가 있으면 포함하세요
-
-/no_think"""
-
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+            # Concatenate the small variable middle between the static parts
+            system_prompt = "".join(
+                (self._CHAT_PROMPT_HEAD, context_text, self._CHAT_PROMPT_TAIL)
+            )
 
             payload = {
                 "model": self.MODEL_NAME,
@@ -312,15 +422,14 @@ class AIAnalysisService:
                 "max_tokens": 500
             }
 
-            response = requests.post(
+            response = self._session.post(
                 self.API_URL,
-                headers=headers,
                 json=payload,
                 timeout=30
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 if data.get("choices") and len(data["choices"]) > 0:
                     content = data["choices"][0]["message"]["content"].strip()
                     if "<think>" in content:
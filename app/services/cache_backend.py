@@ -0,0 +1,199 @@
+"""
+Cache Backend
+TTL caching for service data, with an optional Redis backend so caches
+are shared across gunicorn workers instead of warmed once per process.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from cachetools import TTLCache
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import xxhash
+
+# Module logger (the app factory configures handlers/levels)
+logger = logging.getLogger(__name__)
+
+# Value-type markers for the serialized Redis payloads
+_ARROW_PREFIX = b"A"
+_JSON_PREFIX = b"J"
+
+
+class _SpillTTLCache(TTLCache):
+    """TTLCache that hands size-evicted entries to a spill callback."""
+
+    def __init__(self, maxsize: int, ttl: int, spill: Callable[[str, Any], None]):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._spill = spill
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._spill(key, value)
+        return key, value
+
+
+class CacheBackend:
+    """TTL cache with a process-local tier and an optional Redis tier.
+
+    Always keeps a local ``TTLCache`` for zero-cost hits. When the
+    ``REDIS_URL`` environment variable is set (and the server is
+    reachable), values are additionally written to Redis with the same
+    TTL, so all workers share one warm cache and upstream APIs are hit
+    once per expiry instead of once per process.
+
+    DataFrames are stored as Arrow IPC buffers (fast columnar reload);
+    everything else is stored as orjson bytes.
+
+    When ``spill_dir`` is set, DataFrames evicted from the local tier
+    for size are written to Feather files and lazily restored on the
+    next access (file mtime enforces the TTL), so a burst of large
+    series doesn't force a re-download once the hot set moves on.
+    """
+
+    def __init__(self, maxsize: int, ttl: int, namespace: str,
+                 spill_dir: Optional[str] = None):
+        """Initialize with TTLCache sizing and a Redis key namespace."""
+        self._ttl = ttl
+        self._namespace = namespace
+        # TTLCache mutates its expiry bookkeeping on reads too and is
+        # not thread-safe; callers hit these caches from thread pools
+        self._lock = threading.RLock()
+        self._spill_dir = Path(spill_dir) if spill_dir else None
+        if self._spill_dir is not None:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+            self._local = _SpillTTLCache(maxsize=maxsize, ttl=ttl,
+                                         spill=self._spill)
+        else:
+            self._local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._redis = self._connect_redis()
+
+    @staticmethod
+    def _connect_redis():
+        """Connect to Redis if REDIS_URL is configured, else None."""
+        redis_url = os.getenv('REDIS_URL')
+        if not redis_url:
+            return None
+        try:
+            import redis
+            client = redis.Redis.from_url(redis_url)
+            client.ping()
+            logger.info("Shared Redis cache enabled")
+            return client
+        except Exception as e:
+            logger.warning(f"Redis unavailable, using in-process cache only: {e}")
+            return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on miss."""
+        with self._lock:
+            value = self._local.get(key)
+        if value is not None:
+            return value
+
+        if self._spill_dir is not None:
+            value = self._load_spilled(key)
+            if value is not None:
+                with self._lock:
+                    self._local[key] = value
+                return value
+
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(f"{self._namespace}:{key}")
+            except Exception as e:
+                logger.warning(f"Redis get failed: {e}")
+                return None
+            if raw is not None:
+                value = self._decode(raw)
+                with self._lock:
+                    self._local[key] = value
+                return value
+
+        return None
+
+    def __setitem__(self, key: str, value: Any):
+        """Store value in the local tier and, if enabled, in Redis."""
+        with self._lock:
+            self._local[key] = value
+
+        if self._redis is not None:
+            try:
+                self._redis.set(
+                    f"{self._namespace}:{key}",
+                    self._encode(value),
+                    ex=self._ttl
+                )
+            except Exception as e:
+                logger.warning(f"Redis set failed: {e}")
+
+    def clear(self):
+        """Clear the local tier and this namespace's Redis keys."""
+        with self._lock:
+            self._local.clear()
+
+        if self._spill_dir is not None:
+            for path in self._spill_dir.glob(f"{self._namespace}_*.feather"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+        if self._redis is not None:
+            try:
+                for redis_key in self._redis.scan_iter(f"{self._namespace}:*"):
+                    self._redis.delete(redis_key)
+            except Exception as e:
+                logger.warning(f"Redis clear failed: {e}")
+
+    def _spill_path(self, key: str) -> Path:
+        """Feather file path for a spilled cache entry."""
+        digest = xxhash.xxh64_hexdigest(key.encode())
+        return self._spill_dir / f"{self._namespace}_{digest}.feather"
+
+    def _spill(self, key: str, value: Any):
+        """Write a size-evicted DataFrame to disk (others are dropped)."""
+        if not isinstance(value, pd.DataFrame):
+            return
+        try:
+            feather.write_feather(value, self._spill_path(key))
+        except Exception as e:
+            logger.warning(f"Cache spill failed: {e}")
+
+    def _load_spilled(self, key: str) -> Optional[pd.DataFrame]:
+        """Restore a spilled DataFrame if present and within the TTL."""
+        path = self._spill_path(key)
+        try:
+            if not path.exists():
+                return None
+            if time.time() - path.stat().st_mtime > self._ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return feather.read_feather(path)
+        except Exception as e:
+            logger.warning(f"Cache spill read failed: {e}")
+            return None
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Serialize a value for Redis (Arrow IPC for DataFrames)."""
+        if isinstance(value, pd.DataFrame):
+            table = pa.Table.from_pandas(value, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return _ARROW_PREFIX + sink.getvalue().to_pybytes()
+        return _JSON_PREFIX + orjson.dumps(value)
+
+    @staticmethod
+    def _decode(raw: bytes) -> Any:
+        """Deserialize a Redis payload back to its Python value."""
+        if raw[:1] == _ARROW_PREFIX:
+            return pa.ipc.open_stream(raw[1:]).read_all().to_pandas()
+        return orjson.loads(raw[1:])
@@ -6,7 +6,10 @@ Uses direct HTTP requests to avoid library compatibility issues.
 
 import os
 import logging
-import requests
+import string
+from functools import lru_cache
+import httpx
+import orjson
 from typing import Optional
 
 # Configure logging
@@ -46,10 +49,44 @@ class ChatService:
 - 각 포인트는 1-2문장으로 간결하게 작성하세요
 - 마지막에 [요약] 한 줄을 추가하세요"""
 
+    # SYSTEM_PROMPT compiled once; Template.substitute skips
+    # str.format's per-call field parsing over the full prompt text
+    _SYS_TMPL = string.Template(
+        SYSTEM_PROMPT
+        .replace("{market_context}", "$market_context")
+        .replace("{news_context}", "$news_context")
+    )
+
+    # Fixed request fields, shared by every payload
+    _PAYLOAD_BASE = {
+        "model": MODEL_NAME,
+        "temperature": 0.5,
+        "max_tokens": 2000
+    }
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the chat service with Groq API key."""
         self.api_key = api_key or os.getenv('GROQ_API_KEY')
 
+        # HTTP/2 client: concurrent chat and stream requests multiplex
+        # over a single keep-alive TLS connection instead of serializing
+        # on one HTTP/1.1 stream each; connect errors are retried by
+        # the transport
+        self._http = httpx.Client(
+            # An explicit transport overrides client-level http2/limits,
+            # so both must be configured on the transport itself
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            ),
+            timeout=30,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+        )
+
         if self.api_key:
             logger.info("Groq chat service initialized with Qwen3 32B (HTTP mode)")
         else:
@@ -85,38 +122,29 @@ class ChatService:
             news_context = self._format_news_context(us_news, kr_news)
 
             # Build system prompt with context
-            system_prompt = self.SYSTEM_PROMPT.format(
+            system_prompt = self._SYS_TMPL.substitute(
                 market_context=market_context,
                 news_context=news_context
             )
 
-            # Prepare request
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-
+            # Prepare request (auth headers are set once on the client)
             payload = {
-                "model": self.MODEL_NAME,
+                **self._PAYLOAD_BASE,
                 "messages": [
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": message}
-                ],
-                "temperature": 0.5,
-                "max_tokens": 2000
+                ]
             }
 
             # Make API request
-            response = requests.post(
+            response = self._http.post(
                 self.API_URL,
-                headers=headers,
-                json=payload,
-                timeout=30
+                content=orjson.dumps(payload)
             )
 
             # Handle response
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if data.get("choices") and len(data["choices"]) > 0:
                     content = data["choices"][0]["message"]["content"].strip()
                     # Remove any thinking tags if present
@@ -129,11 +157,16 @@ class ChatService:
                 return "요청 한도를 초과했습니다. 잠시 후 다시 시도해 주세요. (Groq 무료 티어: 30 RPM, 1,000 RPD)"
 
             else:
-                error_msg = response.json().get("error", {}).get("message", "Unknown error")
+                # Only parse JSON error bodies; proxies answer 5xx with
+                # HTML pages that would just raise inside the decoder
+                if "json" in response.headers.get("Content-Type", ""):
+                    error_msg = orjson.loads(response.content).get("error", {}).get("message", "Unknown error")
+                else:
+                    error_msg = response.text[:200]
                 logger.error(f"Groq API error: {response.status_code} - {error_msg}")
                 return f"죄송합니다. 응답 생성 중 오류가 발생했습니다."
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.error("Groq API timeout")
             return "응답 시간이 초과되었습니다. 다시 시도해 주세요."
 
@@ -142,6 +175,99 @@ class ChatService:
             logger.error(f"Error in chat: {error_msg}")
             return f"죄송합니다. 응답 생성 중 오류가 발생했습니다."
 
+    def chat_stream(
+        self,
+        message: str,
+        rate_context: dict = None,
+        us_news: list = None,
+        kr_news: list = None
+    ):
+        """
+        Stream a chat response token by token.
+
+        Yields content fragments as Groq produces them, so the first
+        token arrives after ~200 ms instead of the full generation time,
+        and the complete reply is never buffered in memory.
+
+        Args:
+            message: User's chat message
+            rate_context: Dict with us_rate, kr_rate, spread
+            us_news: List of US news items
+            kr_news: List of Korean news items
+
+        Yields:
+            Response text fragments
+        """
+        if not self.api_key:
+            yield "AI 채팅 서비스를 사용할 수 없습니다. GROQ_API_KEY를 확인해 주세요."
+            return
+
+        try:
+            system_prompt = self._SYS_TMPL.substitute(
+                market_context=self._format_market_context(rate_context),
+                news_context=self._format_news_context(us_news, kr_news)
+            )
+
+            payload = {
+                **self._PAYLOAD_BASE,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": message}
+                ],
+                "stream": True
+            }
+
+            with self._http.stream(
+                "POST",
+                self.API_URL,
+                content=orjson.dumps(payload)
+            ) as response:
+                if response.status_code == 429:
+                    yield "요청 한도를 초과했습니다. 잠시 후 다시 시도해 주세요. (Groq 무료 티어: 30 RPM, 1,000 RPD)"
+                    return
+                elif response.status_code != 200:
+                    logger.error(f"Groq API error: {response.status_code}")
+                    yield "죄송합니다. 응답 생성 중 오류가 발생했습니다."
+                    return
+
+                # Filter <think>...</think> spans across chunk boundaries
+                in_think = False
+                for line in response.iter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    chunk = line[6:]
+                    if chunk == "[DONE]":
+                        break
+
+                    delta = orjson.loads(chunk)["choices"][0]["delta"]
+                    piece = delta.get("content", "")
+                    while piece:
+                        if in_think:
+                            end = piece.find("</think>")
+                            if end == -1:
+                                piece = ""
+                            else:
+                                piece = piece[end + len("</think>"):]
+                                in_think = False
+                        else:
+                            start = piece.find("<think>")
+                            if start == -1:
+                                yield piece
+                                piece = ""
+                            else:
+                                if start:
+                                    yield piece[:start]
+                                piece = piece[start + len("<think>"):]
+                                in_think = True
+
+        except httpx.TimeoutException:
+            logger.error("Groq API timeout")
+            yield "응답 시간이 초과되었습니다. 다시 시도해 주세요."
+
+        except Exception as e:
+            logger.error(f"Error in chat stream: {e}")
+            yield "죄송합니다. 응답 생성 중 오류가 발생했습니다."
+
     def _format_market_context(self, rate_context: dict) -> str:
         """Format rate data for the prompt."""
         if not rate_context:
@@ -166,40 +292,43 @@ class ChatService:
         )
 
     def _format_news_context(self, us_news: list, kr_news: list) -> str:
-        """Format news data for the prompt."""
-        news_parts = []
-
-        # US News
-        if us_news and len(us_news) > 0:
-            news_parts.append("### 미국 금리 관련 뉴스")
-            for i, item in enumerate(us_news[:7], 1):
-                title = item.get('title', '')
-                source = item.get('source', '')
-                snippet = item.get('snippet', '')
-                if title:
-                    news_parts.append(f"{i}. [{source}] {title}")
-                    if snippet:
-                        news_parts.append(f"   요약: {snippet}")
-        else:
-            news_parts.append("### 미국 금리 관련 뉴스\n최신 뉴스 없음")
-
-        news_parts.append("")  # Empty line
-
-        # Korean News
-        if kr_news and len(kr_news) > 0:
-            news_parts.append("### 한국 금리 관련 뉴스")
-            for i, item in enumerate(kr_news[:7], 1):
-                title = item.get('title', '')
-                source = item.get('source', '')
-                snippet = item.get('snippet', '')
-                if title:
-                    news_parts.append(f"{i}. [{source}] {title}")
-                    if snippet:
-                        news_parts.append(f"   요약: {snippet}")
-        else:
-            news_parts.append("### 한국 금리 관련 뉴스\n최신 뉴스 없음")
+        """Format news data for the prompt.
 
-        return "\n".join(news_parts)
+        The same news lists repeat across chat turns while the
+        NewsService cache is warm, so the assembled block is memoized
+        on immutable (title, source, snippet) tuples.
+        """
+        def freeze(items: list) -> tuple:
+            if not items:
+                return ()
+            return tuple(
+                (i.get('title', ''), i.get('source', ''), i.get('snippet', ''))
+                for i in items[:7]
+            )
+
+        return self._format_news_context_cached(freeze(us_news), freeze(kr_news))
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _format_news_context_cached(us_items: tuple, kr_items: tuple) -> str:
+        """Assemble the news context block (cached per unique news set)."""
+        def _fmt(header: str, items: tuple) -> str:
+            if not items:
+                return f"{header}\n최신 뉴스 없음"
+            lines = [header]
+            lines += [
+                f"{i}. [{source}] {title}"
+                + (f"\n   요약: {snippet}" if snippet else "")
+                for i, (title, source, snippet) in enumerate(items, 1)
+                if title
+            ]
+            return "\n".join(lines)
+
+        return (
+            _fmt("### 미국 금리 관련 뉴스", us_items)
+            + "\n\n"
+            + _fmt("### 한국 금리 관련 뉴스", kr_items)
+        )
 
     def is_available(self) -> bool:
         """Check if the chat service is available."""
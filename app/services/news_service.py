@@ -3,12 +3,21 @@ News Service
 Fetches interest rate related news from Google News RSS feeds.
 """
 
+import heapq
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from cachetools import TTLCache
-import feedparser
+import requests
+import xxhash
+from lxml import etree
+
+from app.services.cache_backend import CacheBackend
+from config import NEWS_CACHE_TTL
 from urllib.parse import quote
+from email.utils import parsedate_to_datetime
 import re
 from html import unescape
 
@@ -16,6 +25,18 @@ from html import unescape
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for snippet cleaning (hot per RSS entry)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=2048)
+def _parse_rfc822(date_str: str) -> str:
+    """Parse an RFC-822 date to ISO format (cached; Google News repeats
+    the same pubDate strings across clustered entries). Raises on
+    unparseable input so failures are never cached."""
+    return parsedate_to_datetime(date_str).isoformat()
+
 
 class NewsService:
     """Service for fetching interest rate news from Google News."""
@@ -35,11 +56,16 @@ class NewsService:
         "채권시장 금리"
     ]
     
-    # Cache for news (TTL: 30 minutes)
-    _cache = TTLCache(maxsize=50, ttl=1800)
+    # Cache for news (TTL: 30 minutes); shared via Redis when configured
+    _cache = CacheBackend(maxsize=50, ttl=NEWS_CACHE_TTL, namespace='news')
+
+    # Shared pool for fanning out the per-query RSS fetches
+    _executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix='news')
     
     def __init__(self):
         """Initialize the news service."""
+        # Keep-alive session for the Google News RSS fetches
+        self._session = requests.Session()
         logger.info("News service initialized")
     
     def get_us_rate_news(self, limit: int = 5) -> List[Dict[str, Any]]:
@@ -53,24 +79,25 @@ class NewsService:
             List of news items
         """
         cache_key = f"us_news_{limit}"
-        if cache_key in self._cache:
+        cached = self._cache.get(cache_key)
+        if cached is not None:
             logger.info("Returning cached US news")
-            return self._cache[cache_key]
-        
-        all_news = []
-        for query in self.US_QUERIES:
-            news = self._fetch_google_news(query, lang="en", limit=limit)
-            all_news.extend(news)
-        
-        # Remove duplicates and sort by date
-        unique_news = self._deduplicate_news(all_news)
-        sorted_news = sorted(unique_news, key=lambda x: x.get("published_at", ""), reverse=True)
-        result = sorted_news[:limit]
+            return cached
         
+        # One batched OR query per region: a single round-trip and parse
+        all_news = self._fetch_google_news(
+            " OR ".join(f'"{q}"' for q in self.US_QUERIES),
+            lang="en",
+            limit=limit * 3
+        )
+
+        # Deduplicate and keep the newest `limit` items in one pass
+        result = self._top_news(all_news, limit)
+
         # Cache the result
         self._cache[cache_key] = result
         logger.info(f"Fetched {len(result)} US news items")
-        
+
         return result
     
     def get_kr_rate_news(self, limit: int = 5) -> List[Dict[str, Any]]:
@@ -84,24 +111,25 @@ class NewsService:
             List of news items
         """
         cache_key = f"kr_news_{limit}"
-        if cache_key in self._cache:
+        cached = self._cache.get(cache_key)
+        if cached is not None:
             logger.info("Returning cached Korean news")
-            return self._cache[cache_key]
-        
-        all_news = []
-        for query in self.KR_QUERIES:
-            news = self._fetch_google_news(query, lang="ko", limit=limit)
-            all_news.extend(news)
-        
-        # Remove duplicates and sort by date
-        unique_news = self._deduplicate_news(all_news)
-        sorted_news = sorted(unique_news, key=lambda x: x.get("published_at", ""), reverse=True)
-        result = sorted_news[:limit]
+            return cached
         
+        # One batched OR query per region: a single round-trip and parse
+        all_news = self._fetch_google_news(
+            " OR ".join(f'"{q}"' for q in self.KR_QUERIES),
+            lang="ko",
+            limit=limit * 3
+        )
+
+        # Deduplicate and keep the newest `limit` items in one pass
+        result = self._top_news(all_news, limit)
+
         # Cache the result
         self._cache[cache_key] = result
         logger.info(f"Fetched {len(result)} Korean news items")
-        
+
         return result
     
     def get_all_news(self, limit: int = 5) -> Dict[str, List[Dict[str, Any]]]:
@@ -114,9 +142,13 @@ class NewsService:
         Returns:
             Dictionary with 'us' and 'kr' news lists
         """
+        # Overlap the two regions on the shared pool so the pair
+        # completes in ~max(single-region latency), not the sum
+        f_us = self._executor.submit(self.get_us_rate_news, limit)
+        f_kr = self._executor.submit(self.get_kr_rate_news, limit)
         return {
-            "us": self.get_us_rate_news(limit),
-            "kr": self.get_kr_rate_news(limit)
+            "us": f_us.result(timeout=30),
+            "kr": f_kr.result(timeout=30)
         }
     
     def _fetch_google_news(self, query: str, lang: str = "en", limit: int = 5) -> List[Dict[str, Any]]:
@@ -134,61 +166,65 @@ class NewsService:
         try:
             # Build RSS URL
             encoded_query = quote(query)
-            
+
             if lang == "ko":
                 url = f"{self.GOOGLE_NEWS_RSS_BASE}?q={encoded_query}&hl=ko&gl=KR&ceid=KR:ko"
             else:
                 url = f"{self.GOOGLE_NEWS_RSS_BASE}?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
-            
-            # Parse RSS feed
-            feed = feedparser.parse(url)
-            
-            if feed.bozo and not feed.entries:
-                logger.warning(f"Failed to parse RSS feed for query: {query}")
-                return []
-            
+
+            # Fetch and parse with lxml (C-based, much faster than a
+            # pure-Python feed parser for these small feeds)
+            # Split connect/read timeouts: a dead connect fails in ~3 s
+            # instead of pinning a pool worker for the full 10 s
+            response = self._session.get(url, timeout=(3.05, 10))
+            response.raise_for_status()
+            root = etree.fromstring(response.content)
+
             news_items = []
-            for entry in feed.entries[:limit]:
+            for entry in root.findall(".//item")[:limit]:
                 item = self._parse_rss_entry(entry)
                 if item:
                     news_items.append(item)
-            
+
             return news_items
-            
+
+        except etree.XMLSyntaxError:
+            logger.warning(f"Failed to parse RSS feed for query: {query}")
+            return []
         except Exception as e:
             logger.error(f"Error fetching news for query '{query}': {e}")
             return []
     
-    def _parse_rss_entry(self, entry: Dict) -> Optional[Dict[str, Any]]:
+    def _parse_rss_entry(self, entry: etree._Element) -> Optional[Dict[str, Any]]:
         """
-        Parse a single RSS entry into news item format.
-        
+        Parse a single RSS <item> element into news item format.
+
         Args:
-            entry: RSS entry from feedparser
-            
+            entry: <item> element from the parsed RSS tree
+
         Returns:
             Formatted news item or None
         """
         try:
             # Extract title
-            title = unescape(entry.get("title", ""))
-            
+            title = unescape(entry.findtext("title", ""))
+
             # Extract source from title (Google News format: "Title - Source")
             source = "Unknown"
             if " - " in title:
                 parts = title.rsplit(" - ", 1)
                 title = parts[0]
                 source = parts[1] if len(parts) > 1 else "Unknown"
-            
+
             # Extract URL
-            url = entry.get("link", "")
-            
+            url = entry.findtext("link", "")
+
             # Extract published date
-            published = entry.get("published", "")
+            published = entry.findtext("pubDate", "")
             published_at = self._parse_date(published)
-            
+
             # Extract snippet/summary
-            summary = entry.get("summary", "")
+            summary = entry.findtext("description", "")
             snippet = self._clean_snippet(summary)
             
             return {
@@ -196,7 +232,7 @@ class NewsService:
                 "source": source[:50],
                 "url": url,
                 "published_at": published_at,
-                "snippet": snippet[:300] if snippet else ""
+                "snippet": snippet  # Already trimmed by _clean_snippet
             }
             
         except Exception as e:
@@ -214,9 +250,7 @@ class NewsService:
             ISO format date string
         """
         try:
-            from email.utils import parsedate_to_datetime
-            dt = parsedate_to_datetime(date_str)
-            return dt.isoformat()
+            return _parse_rfc822(date_str)
         except Exception:
             return datetime.now().isoformat()
     
@@ -230,45 +264,59 @@ class NewsService:
         Returns:
             Plain text string
         """
-        # Remove HTML tags
-        clean = re.sub(r'<[^>]+>', '', html_content)
-        # Unescape HTML entities
-        clean = unescape(clean)
-        # Remove extra whitespace
-        clean = ' '.join(clean.split())
-        return clean
+        # Strip tags, unescape entities, collapse whitespace in one pass
+        return _WS_RE.sub(' ', unescape(_TAG_RE.sub('', html_content))).strip()[:300]
     
-    def _deduplicate_news(self, news_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _top_news(self, news_list: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
         """
-        Remove duplicate news items based on URL.
-        
+        Deduplicate by content and select the newest items in a single pass.
+
+        Google News redirect URLs differ per tracking params even for
+        the same story, so items are keyed on a 64-bit hash of
+        (source, title) instead of the raw URL — the same story from
+        the same outlet dedupes regardless of URL noise, and the seen
+        set holds small ints rather than 200-char strings.
+
         Args:
             news_list: List of news items
-            
+            limit: Number of items to keep
+
         Returns:
-            Deduplicated list
+            Up to `limit` unique items, newest first
         """
-        seen_urls = set()
-        unique = []
-        
-        for item in news_list:
-            url = item.get("url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique.append(item)
-        
-        return unique
+        seen_keys = set()
+
+        def unique():
+            for item in news_list:
+                key = xxhash.xxh64_intdigest(
+                    (item.get("source", "") + "\x1f" + item.get("title", "")[:80]).encode()
+                )
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    yield item
+
+        return heapq.nlargest(limit, unique(), key=lambda x: x.get("published_at", ""))
     
     def get_relative_time(self, iso_date: str) -> str:
         """
         Convert ISO date to relative time string (e.g., "2시간 전").
-        
+
+        Memoized per (timestamp, minute) since the same published_at
+        strings repeat across consecutive polls and the result only
+        changes minute to minute.
+
         Args:
             iso_date: ISO format date string
-            
+
         Returns:
             Relative time string in Korean
         """
+        return self._relative_time_cached(iso_date, int(time.time() // 60))
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _relative_time_cached(iso_date: str, _minute: int) -> str:
+        """Parse and format a relative time string (cached per minute)."""
         try:
             dt = datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
             now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
@@ -3,20 +3,57 @@ Interest Rate Data Service
 Fetches US and Korean 10-Year Treasury yields from FRED and ECOS APIs.
 """
 
+import math
 import os
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import lru_cache
-from cachetools import TTLCache
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 import logging
 
+from app.services.cache_backend import CacheBackend
+from config import DEFAULT_DAYS, RATE_CACHE_TTL
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Sentinel returned when an upstream API answers 304 Not Modified
+NOT_MODIFIED = object()
+
+
+def _ffill(arr: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs in a float array (leading NaNs are preserved)."""
+    mask = ~np.isnan(arr)
+    pos = np.where(mask, np.arange(len(arr)), 0)
+    np.maximum.accumulate(pos, out=pos)
+    return arr[pos]
+
+
+def _parse_ecos_dates(times: List[str]) -> np.ndarray:
+    """Parse ECOS YYYYMMDD date strings to a datetime64[D] array.
+
+    Rewrites the digits into ISO YYYY-MM-DD form with byte-level array
+    ops and views the result as datetime64, avoiding pandas'
+    per-element format parsing.
+    """
+    raw = np.array(times, dtype="S8").view("S1").reshape(-1, 8)
+    iso = np.empty((len(times), 10), dtype="S1")
+    iso[:, :4] = raw[:, :4]
+    iso[:, 4] = b"-"
+    iso[:, 5:7] = raw[:, 4:6]
+    iso[:, 7] = b"-"
+    iso[:, 8:] = raw[:, 6:]
+    return iso.view("S10").ravel().astype("datetime64[D]")
+
+
 class RateDataService:
     """Service for fetching interest rate data from FRED and ECOS APIs."""
     
@@ -29,13 +66,47 @@ class RateDataService:
     ECOS_TABLE_CODE = "817Y002"  # 채권/금리 (국고채 10년)
     ECOS_ITEM_CODE = "010210000"  # 국고채(10년)
     
-    # Cache for rate data (TTL: 1 hour)
-    _cache = TTLCache(maxsize=100, ttl=3600)
+    # Cache for rate data (TTL: 1 hour); shared via Redis when
+    # configured, with size-evicted DataFrames spilled to Feather files
+    _cache = CacheBackend(maxsize=100, ttl=RATE_CACHE_TTL, namespace='rate',
+                          spill_dir='cache')
+
+    # Latest-rates snapshot (TTL: 10 minutes); the hot path behind the
+    # chat rate context, kept fresher than the base series cache
+    _latest_cache = CacheBackend(maxsize=4, ttl=600, namespace='rate_latest')
+
+    # Pool for concurrent ECOS page fetches; the worker count doubles as
+    # a cap on simultaneous calls against the ECOS API
+    _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ecos')
     
     def __init__(self, fred_api_key: Optional[str] = None, ecos_api_key: Optional[str] = None):
         """Initialize the service with API keys."""
         self.fred_api_key = fred_api_key or os.getenv('FRED_API_KEY')
         self.ecos_api_key = ecos_api_key or os.getenv('ECOS_API_KEY')
+
+        # Conditional-GET state, kept past the cache TTL and bounded to
+        # one entry per series ('us'/'kr'): validators (ETag/Last-
+        # Modified) and the last good DataFrame, each tagged with the
+        # cache key they were captured under — the date range shifts
+        # daily, and a mismatched key must not resurrect stale data
+        self._validators: Dict[str, tuple] = {}  # series -> (etag, last_modified, cache_key)
+        self._stale: Dict[str, tuple] = {}       # series -> (cache_key, DataFrame)
+
+        # Pooled keep-alive session; retries with exponential backoff are
+        # handled by urllib3 (including Retry-After on 429)
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504]
+                )
+            )
+        )
         
         if not self.fred_api_key:
             logger.warning("FRED API key not provided. US rate data will not be available.")
@@ -54,9 +125,10 @@ class RateDataService:
             DataFrame with columns: date, us_rate
         """
         cache_key = f"us_{start_date}_{end_date}"
-        if cache_key in self._cache:
+        cached = self._cache.get(cache_key)
+        if cached is not None:
             logger.info("Returning cached US rate data")
-            return self._cache[cache_key]
+            return cached
         
         if not self.fred_api_key:
             logger.error("FRED API key is required")
@@ -72,21 +144,39 @@ class RateDataService:
                 "sort_order": "asc"
             }
             
-            response = self._make_request(self.FRED_BASE_URL, params)
-            
+            response = self._conditional_request('us', cache_key, self.FRED_BASE_URL, params)
+
+            if response is NOT_MODIFIED:
+                df = self._revalidated('us', cache_key)
+                if df is not None:
+                    logger.info("FRED data unchanged (304), reusing cached observations")
+                    return df
+                response = self._make_request(self.FRED_BASE_URL, params)
+
             if response and "observations" in response:
                 observations = response["observations"]
-                df = pd.DataFrame(observations)
-                
-                # Clean and transform data
-                df = df[["date", "value"]].copy()
-                df["value"] = pd.to_numeric(df["value"], errors="coerce")
-                df = df.dropna(subset=["value"])
-                df.columns = ["date", "us_rate"]
-                df["date"] = pd.to_datetime(df["date"])
-                
-                # Cache the result
+
+                # Build only the two used columns as arrays; FRED marks
+                # missing values with "." so filter those inline. The
+                # conversion still coerces, so one malformed value drops
+                # that row instead of discarding the whole series
+                valid = [o for o in observations if o["value"] != "."]
+                dates = np.array(
+                    [o["date"] for o in valid], dtype="datetime64[D]"
+                ).astype("datetime64[ns]")
+                rates = pd.to_numeric(
+                    [o["value"] for o in valid], errors="coerce"
+                )
+
+                mask = ~np.isnan(rates)
+                df = pd.DataFrame({
+                    "date": dates[mask],
+                    "us_rate": rates[mask]
+                })
+
+                # Cache the result (stale copy kept for 304 revalidation)
                 self._cache[cache_key] = df
+                self._stale['us'] = (cache_key, df)
                 logger.info(f"Fetched {len(df)} US rate observations")
                 return df
             else:
@@ -109,9 +199,10 @@ class RateDataService:
             DataFrame with columns: date, kr_rate
         """
         cache_key = f"kr_{start_date}_{end_date}"
-        if cache_key in self._cache:
+        cached = self._cache.get(cache_key)
+        if cached is not None:
             logger.info("Returning cached Korean rate data")
-            return self._cache[cache_key]
+            return cached
 
         if not self.ecos_api_key:
             logger.error("ECOS API key is required")
@@ -122,53 +213,65 @@ class RateDataService:
             start_ecos = start_date.replace("-", "")
             end_ecos = end_date.replace("-", "")
 
-            # ECOS API returns max 10000 rows per request
-            # Paginate to get all data for long date ranges
-            all_rows = []
+            # ECOS API returns max 10000 rows per request.
+            # Probe for the total row count, then fetch all pages
+            # concurrently so latency is ~2 round-trips instead of one
+            # per page.
             page_size = 10000
-            page_num = 1
-
-            while True:
-                start_idx = (page_num - 1) * page_size + 1
-                end_idx = page_num * page_size
+            probe = self._conditional_request(
+                'kr', cache_key, self._ecos_url(start_ecos, end_ecos, 1, 1)
+            )
 
-                # Build ECOS API URL with pagination
-                url = (
-                    f"{self.ECOS_BASE_URL}/{self.ecos_api_key}/json/kr/{start_idx}/{end_idx}/"
-                    f"{self.ECOS_TABLE_CODE}/D/{start_ecos}/{end_ecos}/{self.ECOS_ITEM_CODE}"
+            if probe is NOT_MODIFIED:
+                df = self._revalidated('kr', cache_key)
+                if df is not None:
+                    logger.info("ECOS data unchanged (304), reusing cached observations")
+                    return df
+                probe = self._make_request(
+                    self._ecos_url(start_ecos, end_ecos, 1, 1)
                 )
 
-                response = self._make_request(url)
-
-                if response and "StatisticSearch" in response:
-                    rows = response["StatisticSearch"].get("row", [])
-                    if rows:
-                        all_rows.extend(rows)
-                        logger.info(f"ECOS page {page_num}: fetched {len(rows)} rows")
+            total = 0
+            if probe and "StatisticSearch" in probe:
+                total = int(probe["StatisticSearch"].get("list_total_count", 0))
 
-                        # If we got less than page_size, we've reached the end
-                        if len(rows) < page_size:
-                            break
-                        page_num += 1
-                    else:
-                        break
-                else:
-                    break
+            all_rows = []
+            if total:
+                pages = math.ceil(total / page_size)
+                ranges = [
+                    (page * page_size + 1, (page + 1) * page_size)
+                    for page in range(pages)
+                ]
+                for rows in self._executor.map(
+                    lambda r: self._fetch_ecos_page(start_ecos, end_ecos, *r),
+                    ranges
+                ):
+                    all_rows.extend(rows)
+                logger.info(f"ECOS: fetched {len(all_rows)} rows across {pages} pages")
 
             if all_rows:
-                df = pd.DataFrame(all_rows)
-                df = df[["TIME", "DATA_VALUE"]].copy()
-                df.columns = ["date", "kr_rate"]
-
-                # Parse date and rate
-                df["date"] = pd.to_datetime(df["date"], format="%Y%m%d")
-                df["kr_rate"] = pd.to_numeric(df["kr_rate"], errors="coerce")
-                df = df.dropna(subset=["kr_rate"])
-                df = df.drop_duplicates(subset=["date"])  # Remove any duplicates
-                df = df.sort_values("date").reset_index(drop=True)
-
-                # Cache the result
+                # Extract only the two used fields; dates are parsed by
+                # reshaping the YYYYMMDD bytes into ISO form and viewing
+                # as datetime64 — no per-row strptime
+                dates = _parse_ecos_dates([r["TIME"] for r in all_rows])
+                vals = pd.to_numeric(
+                    [r["DATA_VALUE"] for r in all_rows], errors="coerce"
+                )
+
+                valid = ~np.isnan(vals)
+                dates, vals = dates[valid], vals[valid]
+
+                # np.unique sorts and keeps the first index per date,
+                # replacing drop_duplicates + sort_values in one pass
+                dates, first_idx = np.unique(dates, return_index=True)
+                df = pd.DataFrame({
+                    "date": dates.astype("datetime64[ns]"),
+                    "kr_rate": vals[first_idx]
+                })
+
+                # Cache the result (stale copy kept for 304 revalidation)
                 self._cache[cache_key] = df
+                self._stale['kr'] = (cache_key, df)
                 logger.info(f"Fetched total {len(df)} Korean rate observations")
                 return df
             else:
@@ -179,20 +282,38 @@ class RateDataService:
             logger.error(f"Error fetching Korean rate data: {e}")
             return self._get_mock_kr_data(start_date, end_date)
     
-    def get_combined_rates(self, days: int = 90) -> pd.DataFrame:
+    def _ecos_url(self, start_ecos: str, end_ecos: str, start_idx: int, end_idx: int) -> str:
+        """Build an ECOS StatisticSearch URL for one page of results."""
+        return (
+            f"{self.ECOS_BASE_URL}/{self.ecos_api_key}/json/kr/{start_idx}/{end_idx}/"
+            f"{self.ECOS_TABLE_CODE}/D/{start_ecos}/{end_ecos}/{self.ECOS_ITEM_CODE}"
+        )
+
+    def _fetch_ecos_page(self, start_ecos: str, end_ecos: str,
+                         start_idx: int, end_idx: int) -> List[Dict]:
+        """Fetch a single ECOS result page, returning its rows (or [])."""
+        response = self._make_request(
+            self._ecos_url(start_ecos, end_ecos, start_idx, end_idx)
+        )
+        if response and "StatisticSearch" in response:
+            return response["StatisticSearch"].get("row", [])
+        return []
+
+    def get_combined_rates(self, days: int = DEFAULT_DAYS) -> pd.DataFrame:
         """
         Get combined US and Korean rate data with spread calculation.
-        
+
         Args:
-            days: Number of days of data to fetch (default: 90)
+            days: Number of days of data to fetch (default: DEFAULT_DAYS)
             
         Returns:
             DataFrame with columns: date, us_rate, kr_rate, spread
         """
         cache_key = f"combined_{days}"
-        if cache_key in self._cache:
+        cached = self._cache.get(cache_key)
+        if cached is not None:
             logger.info("Returning cached combined rate data")
-            return self._cache[cache_key]
+            return cached
         
         # Calculate date range
         end_date = datetime.now()
@@ -209,23 +330,35 @@ class RateDataService:
         if us_df.empty and kr_df.empty:
             logger.warning("Both rate datasets are empty")
             return pd.DataFrame(columns=["date", "us_rate", "kr_rate", "spread"])
-        
-        # Outer merge to keep all dates
-        combined = pd.merge(us_df, kr_df, on="date", how="outer")
-        combined = combined.sort_values("date").reset_index(drop=True)
-        
-        # Forward fill missing values
-        combined["us_rate"] = combined["us_rate"].ffill()
-        combined["kr_rate"] = combined["kr_rate"].ffill()
-        
-        # Drop any remaining NaN rows
-        combined = combined.dropna()
-        
-        # Calculate spread (Korea - US) in basis points
-        combined["spread"] = (combined["kr_rate"] - combined["us_rate"]) * 100
-        
-        # Keep only the most recent 'days' entries
-        combined = combined.tail(days).reset_index(drop=True)
+
+        # Join on raw arrays instead of pd.merge: scatter each series
+        # onto the sorted union of observed dates, forward-fill, and
+        # compute the spread vectorized. One DataFrame is built at the
+        # end rather than rewritten column by column.
+        us_dates = us_df["date"].to_numpy()
+        kr_dates = kr_df["date"].to_numpy()
+        idx = np.union1d(us_dates, kr_dates)
+
+        us = np.full(len(idx), np.nan)
+        us[np.searchsorted(idx, us_dates)] = us_df["us_rate"].to_numpy()
+        kr = np.full(len(idx), np.nan)
+        kr[np.searchsorted(idx, kr_dates)] = kr_df["kr_rate"].to_numpy()
+
+        us = _ffill(us)
+        kr = _ffill(kr)
+
+        # Drop rows where either side is still NaN (leading dates before
+        # one series starts), keep the most recent `days` entries
+        valid = ~(np.isnan(us) | np.isnan(kr))
+        idx, us, kr = idx[valid][-days:], us[valid][-days:], kr[valid][-days:]
+
+        combined = pd.DataFrame({
+            "date": idx,
+            "us_rate": us,
+            "kr_rate": kr,
+            # Spread (Korea - US) in basis points
+            "spread": (kr - us) * 100.0
+        })
         
         # Cache the result
         self._cache[cache_key] = combined
@@ -236,13 +369,30 @@ class RateDataService:
     def get_latest_rates(self) -> Dict[str, Any]:
         """
         Get the most recent rate data.
-        
+
+        Fetches only the last week from each API and computes the
+        spread on two scalars, instead of running the full 30-day
+        merge/ffill pipeline just to read its last row.
+
         Returns:
             Dictionary with latest rates and metadata
         """
-        combined = self.get_combined_rates(days=30)
-        
-        if combined.empty:
+        cached = self._latest_cache.get("latest")
+        if cached is not None:
+            logger.info("Returning cached latest rates")
+            return cached
+
+        # A week covers weekends and holiday gaps for both markets
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=7)
+
+        start_str = start_date.strftime("%Y-%m-%d")
+        end_str = end_date.strftime("%Y-%m-%d")
+
+        us_df = self.get_us_treasury_10y(start_str, end_str)
+        kr_df = self.get_kr_treasury_10y(start_str, end_str)
+
+        if us_df.empty or kr_df.empty:
             return {
                 "us_rate": None,
                 "kr_rate": None,
@@ -250,47 +400,113 @@ class RateDataService:
                 "date": None,
                 "error": "No data available"
             }
-        
-        latest = combined.iloc[-1]
-        
-        return {
-            "us_rate": round(float(latest["us_rate"]), 3),
-            "kr_rate": round(float(latest["kr_rate"]), 3),
-            "spread": round(float(latest["spread"]), 1),
-            "date": latest["date"].strftime("%Y-%m-%d"),
+
+        us_rate = float(us_df["us_rate"].iloc[-1])
+        kr_rate = float(kr_df["kr_rate"].iloc[-1])
+
+        result = {
+            "us_rate": round(us_rate, 3),
+            "kr_rate": round(kr_rate, 3),
+            "spread": round((kr_rate - us_rate) * 100, 1),
+            "date": max(us_df["date"].iloc[-1], kr_df["date"].iloc[-1]).strftime("%Y-%m-%d"),
             "error": None
         }
+
+        self._latest_cache["latest"] = result
+        return result
     
-    def _make_request(self, url: str, params: Optional[Dict] = None, max_retries: int = 3) -> Optional[Dict]:
+    def _make_request(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
         """
-        Make HTTP request with retry logic.
-        
+        Make HTTP request on the pooled session.
+
+        Retries with exponential backoff are handled by the session's
+        urllib3 Retry configuration.
+
         Args:
             url: Request URL
             params: Query parameters (optional)
-            max_retries: Maximum number of retries
-            
+
         Returns:
             JSON response or None
         """
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
-                wait_time = 2 ** attempt  # Exponential backoff
-                logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    import time
-                    time.sleep(wait_time)
-        
+        try:
+            response = self._session.get(url, params=params, timeout=30)
+            response.raise_for_status()
+            if "json" not in response.headers.get("Content-Type", ""):
+                logger.warning(f"Non-JSON response ({response.status_code}) from {url}")
+                return None
+            return orjson.loads(response.content)
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Request failed after retries: {e}")
+            return None
+
+    def _conditional_request(self, series: str, cache_key: str, url: str,
+                             params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        GET with the series' stored ETag/Last-Modified validators.
+
+        When the cache has expired but the upstream data is unchanged,
+        the server answers 304 with an empty body and the caller can
+        resurrect its last DataFrame instead of re-parsing the full
+        series. Validators from 200 responses are kept for the next
+        refresh; they are only sent when the current cache key matches
+        the one they were captured under, so a shifted date range
+        always does a full fetch.
+
+        Args:
+            series: Series slot the validators live under ('us'/'kr')
+            cache_key: Cache key of the current request
+            url: Request URL
+            params: Query parameters (optional)
+
+        Returns:
+            JSON response, NOT_MODIFIED on 304, or None on error
+        """
+        headers = {}
+        validators = self._validators.get(series)
+        if validators and validators[2] == cache_key:
+            etag, last_modified, _ = validators
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = self._session.get(
+                url, params=params, timeout=30, headers=headers or None
+            )
+            if response.status_code == 304:
+                return NOT_MODIFIED
+            response.raise_for_status()
+
+            if "json" not in response.headers.get("Content-Type", ""):
+                logger.warning(f"Non-JSON response ({response.status_code}) from {url}")
+                return None
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._validators[series] = (etag, last_modified, cache_key)
+
+            return orjson.loads(response.content)
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Request failed after retries: {e}")
+            return None
+
+    def _revalidated(self, series: str, cache_key: str) -> Optional[pd.DataFrame]:
+        """Re-cache and return the stale DataFrame after a 304, if kept."""
+        stale = self._stale.get(series)
+        if stale is not None and stale[0] == cache_key:
+            df = stale[1]
+            self._cache[cache_key] = df  # Revalidated: extend the TTL
+            return df
+        # 304 but no matching stale copy (fresh process): drop the
+        # validators so the caller falls back to an unconditional fetch
+        self._validators.pop(series, None)
         return None
     
     def _get_mock_us_data(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Generate mock US rate data for development/testing."""
-        import numpy as np
-        
         dates = pd.date_range(start=start_date, end=end_date, freq='B')  # Business days
         base_rate = 4.25
         np.random.seed(42)
@@ -303,8 +519,6 @@ class RateDataService:
     
     def _get_mock_kr_data(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Generate mock Korean rate data for development/testing."""
-        import numpy as np
-        
         dates = pd.date_range(start=start_date, end=end_date, freq='B')  # Business days
         base_rate = 3.45
         np.random.seed(43)
@@ -318,6 +532,9 @@ class RateDataService:
     def clear_cache(self):
         """Clear all cached data."""
         self._cache.clear()
+        self._latest_cache.clear()
+        self._validators.clear()
+        self._stale.clear()
         logger.info("Rate data cache cleared")
 
 
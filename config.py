@@ -1,20 +1,53 @@
 import os
-from dotenv import load_dotenv
+import sys
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables: prefer the baked module emitted by
+# tools/bake_env.py (served from bytecode cache, no per-process .env
+# parse), falling back to python-dotenv when it hasn't been generated
+try:
+    from env_baked import ENV as _BAKED_ENV
+    for _key, _value in _BAKED_ENV.items():
+        if _value is not None:
+            os.environ.setdefault(_key, _value)
+except ImportError:
+    # Production (render.yaml) injects env vars via the platform, so
+    # only parse a local .env outside production, and only if present.
+    # Anchor the path next to this file so startup CWD doesn't matter.
+    _ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+    if os.path.exists(_ENV_FILE) and os.environ.get('FLASK_ENV') != 'production':
+        from dotenv import load_dotenv
+        load_dotenv(_ENV_FILE)
+
+# Environment snapshot as a plain dict: os.environ re-encodes keys and
+# decodes values on every access, a dict .get is a single hash lookup
+_ENV = dict(os.environ)
+
+
+def refresh_env_cache():
+    """Re-snapshot os.environ after the environment has been mutated."""
+    global _ENV
+    _ENV = dict(os.environ)
+
+
+# Interned env key names: lookups against the snapshot reuse the
+# cached string hash, and the key set lives in one place
+_K_SECRET_KEY = sys.intern('SECRET_KEY')
+_K_FRED_API_KEY = sys.intern('FRED_API_KEY')
+_K_ECOS_API_KEY = sys.intern('ECOS_API_KEY')
+_K_GEMINI_API_KEY = sys.intern('GEMINI_API_KEY')
+_K_FLASK_ENV = sys.intern('FLASK_ENV')
 
 
 class Config:
     """Base configuration class."""
-    
+
     # Flask
-    SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
-    
+    SECRET_KEY = _ENV.get(_K_SECRET_KEY, 'dev-secret-key-change-in-production')
+
     # API Keys
-    FRED_API_KEY = os.getenv('FRED_API_KEY')
-    ECOS_API_KEY = os.getenv('ECOS_API_KEY')
-    GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
+    FRED_API_KEY = _ENV.get(_K_FRED_API_KEY)
+    ECOS_API_KEY = _ENV.get(_K_ECOS_API_KEY)
+    GEMINI_API_KEY = _ENV.get(_K_GEMINI_API_KEY)
     
     # Cache Settings (in seconds)
     RATE_CACHE_TTL = 3600  # 1 hour for rate data
@@ -23,6 +56,11 @@ class Config:
     
     # Data Settings
     DEFAULT_DAYS = 90  # Default period for rate data
+
+    # Response Compression (Flask-Compress)
+    COMPRESS_ALGORITHM = ['br', 'gzip']  # Brotli preferred, gzip fallback
+    COMPRESS_MIN_SIZE = 512
+    COMPRESS_LEVEL = 4
     
     # API Rate Limiting
     RATE_LIMIT_PER_MINUTE = 60
@@ -46,16 +84,25 @@ class TestingConfig(Config):
     TESTING = True
 
 
-# Configuration dictionary
-config = {
-    'development': DevelopmentConfig,
-    'production': ProductionConfig,
-    'testing': TestingConfig,
-    'default': DevelopmentConfig
-}
+# Frozen module-level mirrors of the tuning values the services read
+# directly: importing these names costs one global load instead of a
+# class MRO walk, and keeps each TTL defined in a single place
+RATE_CACHE_TTL = Config.RATE_CACHE_TTL
+ANALYSIS_CACHE_TTL = Config.ANALYSIS_CACHE_TTL
+NEWS_CACHE_TTL = Config.NEWS_CACHE_TTL
+DEFAULT_DAYS = Config.DEFAULT_DAYS
+
+
+# Configuration class resolved once at import; FLASK_ENV doesn't
+# change mid-process, and unknown values fall back to development
+_env = _ENV.get(_K_FLASK_ENV, 'development')
+CONFIG_CLASS = (
+    ProductionConfig if _env == 'production'
+    else TestingConfig if _env == 'testing'
+    else DevelopmentConfig
+)
 
 
 def get_config():
-    """Get configuration based on environment."""
-    env = os.getenv('FLASK_ENV', 'development')
-    return config.get(env, config['default'])
+    """Get configuration based on environment (resolved at import)."""
+    return CONFIG_CLASS
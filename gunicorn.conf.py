@@ -10,14 +10,32 @@ bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
 backlog = 2048
 
 # Worker Processes
-workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
-worker_class = 'sync'
+# The workload is I/O-bound on FRED/ECOS/Groq calls: threaded workers
+# multiplex many in-flight upstream requests per process, so far fewer
+# processes (and RSS copies) are needed than with blocking sync workers
+workers = int(os.getenv('GUNICORN_WORKERS', max(2, multiprocessing.cpu_count() // 2)))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+# Import the app once in the master and fork from it: create_app(),
+# dotenv and Config run a single time instead of once per worker, and
+# workers share bytecode/config pages copy-on-write
+preload_app = True
+
 worker_connections = 1000
-max_requests = 1000
-max_requests_jitter = 50
+
+# Recycle workers rarely: frequent recycling throws away warm bytecode,
+# sessions and caches; jitter keeps restarts from aligning
+max_requests = 10000
+max_requests_jitter = 1000
+
 timeout = 30
 graceful_timeout = 30
-keepalive = 2
+
+# Dashboard clients poll every few seconds; keep their connections open
+# instead of forcing a TLS handshake per poll (cheap with gthread,
+# where an idle keepalive socket doesn't hold a worker)
+keepalive = 30
 
 # Server Mechanics
 daemon = False
@@ -45,6 +63,43 @@ def on_starting(server):
     print("Interest Rate Monitor - Production Server")
     print("=" * 50)
 
+    # Warm the service singletons in the master: sessions, compiled
+    # patterns and prompt templates are built once and inherited by
+    # every forked worker copy-on-write, so no worker pays full init
+    # on its first request. No sockets are opened here — open fds must
+    # not cross the fork.
+    from app.services.rate_service import get_rate_service
+    from app.services.news_service import get_news_service
+    from app.services.chat_service import get_chat_service
+    from app.services.ai_analysis_service import get_ai_service
+    get_rate_service()
+    get_news_service()
+    get_chat_service()
+    get_ai_service()
+
+def post_fork(server, worker):
+    """Called just after a worker has been forked."""
+    # With preload_app the environment snapshot was taken in the
+    # master; re-sync it in case the fork environment differs
+    from config import refresh_env_cache
+    refresh_env_cache()
+
+    # Pin each worker to a disjoint slice of the allowed CPUs so its
+    # heap and response buffers stay local without serializing the
+    # worker's threads on a single core (Linux only). With fewer
+    # workers than CPUs each slice holds several cores for the gthread
+    # pool; with more workers than CPUs the slices wrap round-robin.
+    if hasattr(os, 'sched_setaffinity'):
+        try:
+            cpus = sorted(os.sched_getaffinity(0))
+            count = max(getattr(server, 'num_workers', 1) or 1, 1)
+            span = max(1, len(cpus) // count)
+            groups = len(cpus) // span
+            start = (worker.age % groups) * span
+            os.sched_setaffinity(0, set(cpus[start:start + span]))
+        except OSError:
+            pass
+
 def on_reload(server):
     """Called to recycle workers during a reload."""
     print("Reloading workers...")
@@ -9,37 +9,40 @@ import sys
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
+# Environment variables are loaded by config.py (imported via
+# create_app), so no dotenv parse is needed here
 from app import create_app
+from config import _ENV
 
 # Create application instance
 app = create_app()
 
+# Server settings, parsed once at import from the env snapshot
+DEBUG = _ENV.get('FLASK_DEBUG', '1') == '1'
+HOST = _ENV.get('FLASK_HOST', '0.0.0.0')
+PORT = int(_ENV.get('FLASK_PORT', '5000'))
 
-def validate_config():
-    """Validate required configuration."""
-    warnings = []
 
-    if not os.getenv('FRED_API_KEY'):
-        warnings.append("FRED_API_KEY not set - US rate data will use mock data")
+# Required keys and the consequence of running without each one
+REQUIRED_KEYS = {
+    'FRED_API_KEY': "US rate data will use mock data",
+    'ECOS_API_KEY': "Korean rate data will use mock data",
+    'GEMINI_API_KEY': "AI analysis will use default messages",
+}
 
-    if not os.getenv('ECOS_API_KEY'):
-        warnings.append("ECOS_API_KEY not set - Korean rate data will use mock data")
 
-    if not os.getenv('GEMINI_API_KEY'):
-        warnings.append("GEMINI_API_KEY not set - AI analysis will use default messages")
+def validate_config():
+    """Validate required configuration."""
+    # One C-level set difference instead of a lookup per key
+    missing = REQUIRED_KEYS.keys() - _ENV.keys()
 
-    if warnings:
+    if missing:
         print("\n[WARNING] Configuration Warnings:")
-        for warning in warnings:
-            print(f"   - {warning}")
+        for key in sorted(missing):
+            print(f"   - {key} not set - {REQUIRED_KEYS[key]}")
         print()
 
-    return len(warnings) == 0
+    return not missing
 
 
 if __name__ == '__main__':
@@ -50,18 +53,13 @@ if __name__ == '__main__':
     # Validate configuration
     validate_config()
 
-    # Get configuration
-    debug = os.getenv('FLASK_DEBUG', '1') == '1'
-    host = os.getenv('FLASK_HOST', '0.0.0.0')
-    port = int(os.getenv('FLASK_PORT', 5000))
-
-    print(f"Starting server on http://{host}:{port}")
-    print(f"Debug mode: {'ON' if debug else 'OFF'}")
+    print(f"Starting server on http://{HOST}:{PORT}")
+    print(f"Debug mode: {'ON' if DEBUG else 'OFF'}")
     print("=" * 60 + "\n")
-    
+
     # Run the application
     app.run(
-        host=host,
-        port=port,
-        debug=debug
+        host=HOST,
+        port=PORT,
+        debug=DEBUG
     )
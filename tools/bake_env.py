@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Bake .env into an importable env_baked.py module.
+
+python-dotenv re-reads and tokenizes the .env file in every process
+that imports config.py — once per gunicorn worker. Baking the values
+into a plain Python module lets the import system serve them from the
+cached .pyc instead.
+
+Usage:
+    python tools/bake_env.py
+
+Re-run after editing .env. The generated env_baked.py contains
+secrets; it is gitignored and must never be committed.
+"""
+
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+
+def main():
+    root = Path(__file__).resolve().parent.parent
+    values = dotenv_values(root / '.env')
+
+    lines = [
+        "# Generated by tools/bake_env.py - do not edit or commit",
+        "ENV = {",
+    ]
+    lines += [f"    {key!r}: {value!r}," for key, value in values.items()]
+    lines.append("}")
+
+    (root / 'env_baked.py').write_text("\n".join(lines) + "\n")
+    print(f"Baked {len(values)} entries into env_baked.py")
+
+
+if __name__ == '__main__':
+    main()